@@ -1,7 +1,9 @@
 """COMTRADE Reader.
 
 Modules:
+    catalog: Indexes .cfg metadata for fast search.
     comtrade: Main, loads both cfg and dat files.
     configuration: Loads .cfg files.
     data: Loads .dat files.
+    shared: Shares loaded records between processes.
 """
@@ -0,0 +1,255 @@
+import logging
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from pytrade.configuration import Configuration
+
+if TYPE_CHECKING:
+    import datetime as dt
+    from typing import Iterator, Sequence
+
+    from pytrade.configuration import DataType
+
+logger = logging.getLogger(__name__)
+
+CFG_SUFFIX = ".cfg"
+DAT_SUFFIXES = (".dat", ".DAT", ".Dat")
+EXTRACT_CHUNK_SIZE = 64
+ExtractReturn = tuple[tuple[str | int | None, ...], list[tuple[str, str, str, int]]]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    cfg_path TEXT PRIMARY KEY,
+    dat_path TEXT,
+    mtime_ns INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    station_name TEXT NOT NULL,
+    identification TEXT NOT NULL,
+    revision INTEGER NOT NULL,
+    start_datetime TEXT NOT NULL,
+    trigger_datetime TEXT NOT NULL,
+    data_file_type TEXT NOT NULL,
+    sample_rate TEXT NOT NULL,
+    last_sample INTEGER NOT NULL,
+    total_analog INTEGER NOT NULL,
+    total_digital INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS channels (
+    cfg_path TEXT NOT NULL REFERENCES records (cfg_path) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS failures (
+    cfg_path TEXT PRIMARY KEY,
+    dat_path TEXT,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_id ON records (id);
+CREATE INDEX IF NOT EXISTS records_station_name ON records (station_name);
+CREATE INDEX IF NOT EXISTS records_trigger_datetime ON records (trigger_datetime);
+CREATE INDEX IF NOT EXISTS channels_name ON channels (name);
+CREATE INDEX IF NOT EXISTS channels_cfg_path ON channels (cfg_path);
+"""
+
+
+class CatalogEntry(NamedTuple):
+    cfg_path: Path
+    dat_path: Path | None
+
+
+def _find_dat(cfg_path: Path) -> Path | None:
+    for suffix in DAT_SUFFIXES:
+        dat_path = cfg_path.with_suffix(suffix)
+        if dat_path.is_file():
+            return dat_path
+    return None
+
+
+def _format_datetime(value: "dt.datetime") -> str:
+    # .cfg datetimes are naive, an offset suffix would break the ordering of the stored strings
+    if value.tzinfo is not None:
+        msg = f"{value} must be a naive datetime, as the .cfg datetimes"
+        raise ValueError(msg)
+    return value.isoformat(timespec="microseconds")
+
+
+def _extract(cfg_path: Path, dat_path: Path | None, mtime_ns: int) -> ExtractReturn | None:
+    """Loads a single .cfg file and flattens it into catalog rows.
+
+    Runs inside the worker processes, so it only deals with picklable values.
+
+    Args:
+        cfg_path: Path to the .cfg file.
+        dat_path: Path to the matching .dat file, if any.
+        mtime_ns: Modification time of the .cfg file when it was scanned.
+
+    Returns:
+        The record row and its channel rows, or None if the .cfg file could not be loaded.
+    """
+    try:
+        cfg = Configuration.load(cfg_path)
+    except (OSError, UnicodeDecodeError, ValueError, ArithmeticError, NotImplementedError):
+        logger.warning("Skipping %s, unable to load .cfg file", cfg_path, exc_info=True)
+        return None
+    record = (
+        str(cfg_path), None if dat_path is None else str(dat_path), mtime_ns, cfg.id, cfg.station_name,
+        cfg.identification, cfg.revision, _format_datetime(cfg.start_datetime),
+        _format_datetime(cfg.trigger_datetime), cfg.data_file_type.value, str(cfg.sample_rate),
+        cfg.last_sample, cfg.total_analog, cfg.total_digital,
+    )
+    channels = [(str(cfg_path), "analog", name, index) for index, name in enumerate(cfg.analogs_order)]
+    channels.extend((str(cfg_path), "digital", name, index) for index, name in enumerate(cfg.digitals_order))
+    return record, channels
+
+
+class Catalog:
+    """SQLite index of the .cfg metadata found under one or more archive folders.
+
+    Only .cfg files are parsed, .dat files are located by name and never opened.
+    """
+
+    __slots__ = ("_connection",)
+
+    def __init__(self: "Catalog", path: "Path | str") -> None:
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(SCHEMA)
+
+    def close(self: "Catalog") -> None:
+        self._connection.close()
+
+    def __enter__(self: "Catalog") -> "Catalog":
+        return self
+
+    def __exit__(self: "Catalog", *_: object) -> None:
+        self.close()
+
+    def __len__(self: "Catalog") -> int:
+        return int(self._connection.execute("SELECT COUNT(*) FROM records").fetchone()[0])
+
+    def update(self: "Catalog", root: "Path", *, workers: int | None = None) -> int:
+        """Indexes every .cfg file under root, reloading only new or modified ones.
+
+        Entries for .cfg files that no longer exist under root are removed. Files that fail to load are left out
+        of the results and only retried once they are modified again.
+
+        Args:
+            root: Folder to scan recursively.
+            workers: Number of worker processes used to load .cfg files, defaults to the number of CPUs.
+
+        Returns:
+            Number of entries added or refreshed.
+        """
+        root = root.resolve()
+        indexed = {
+            cfg_path: (mtime_ns, dat_path)
+            for cfg_path, mtime_ns, dat_path in self._connection.execute(
+                "SELECT cfg_path, mtime_ns, dat_path FROM records "
+                "UNION ALL SELECT cfg_path, mtime_ns, dat_path FROM failures",
+            )
+            if Path(cfg_path).is_relative_to(root)
+        }
+        found = set()
+        stale = []
+        for cfg_path in root.rglob("*"):
+            if cfg_path.suffix.lower() != CFG_SUFFIX or not cfg_path.is_file():
+                continue
+            found.add(str(cfg_path))
+            mtime_ns = cfg_path.stat().st_mtime_ns
+            dat_path = _find_dat(cfg_path)
+            if indexed.get(str(cfg_path)) != (mtime_ns, None if dat_path is None else str(dat_path)):
+                stale.append((cfg_path, dat_path, mtime_ns))
+
+        with self._connection:
+            removed = [(cfg_path,) for cfg_path in indexed.keys() - found]
+            self._connection.executemany("DELETE FROM records WHERE cfg_path = ?", removed)
+            self._connection.executemany("DELETE FROM failures WHERE cfg_path = ?", removed)
+            if not stale:
+                return 0
+            updated = 0
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                extracted_stale = executor.map(_extract, *zip(*stale, strict=True), chunksize=EXTRACT_CHUNK_SIZE)
+                for (cfg_path, dat_path, mtime_ns), extracted in zip(stale, extracted_stale, strict=True):
+                    self._connection.execute("DELETE FROM records WHERE cfg_path = ?", (str(cfg_path),))
+                    self._connection.execute("DELETE FROM failures WHERE cfg_path = ?", (str(cfg_path),))
+                    if extracted is None:
+                        self._connection.execute(
+                            "INSERT INTO failures VALUES (?, ?, ?)",
+                            (str(cfg_path), None if dat_path is None else str(dat_path), mtime_ns),
+                        )
+                        continue
+                    record, channels = extracted
+                    self._connection.execute(
+                        "INSERT INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", record,
+                    )
+                    self._connection.executemany("INSERT INTO channels VALUES (?, ?, ?, ?)", channels)
+                    updated += 1
+        logger.debug("Catalog updated: %d refreshed, %d removed", updated, len(removed))
+        return updated
+
+    def search(  # noqa: PLR0913
+        self: "Catalog",
+        *,
+        record_id: str | None = None,
+        station_name: str | None = None,
+        identification: str | None = None,
+        channels: "Sequence[str]" = (),
+        trigger_from: "dt.datetime | None" = None,
+        trigger_to: "dt.datetime | None" = None,
+        data_file_type: "DataType | None" = None,
+    ) -> "Iterator[CatalogEntry]":
+        """Finds indexed records matching every given filter.
+
+        Args:
+            record_id: Configuration id (station name and recording device identification).
+            station_name: Station name.
+            identification: Recording device identification.
+            channels: Analog or digital channel identifiers that must all be present in the record.
+            trigger_from: Earliest trigger datetime (naive, as in the .cfg file), inclusive.
+            trigger_to: Latest trigger datetime (naive, as in the .cfg file), inclusive.
+            data_file_type: Type of the .dat file.
+
+        Yields:
+            Paths to the .cfg and .dat files, ordered by trigger datetime.
+
+        Raises:
+            ValueError: If trigger_from or trigger_to is timezone aware.
+        """
+        clauses = []
+        parameters: list[str | int] = []
+        for column, value in (
+            ("id", record_id),
+            ("station_name", station_name),
+            ("identification", identification),
+            ("data_file_type", None if data_file_type is None else data_file_type.value),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                parameters.append(value)
+        if trigger_from is not None:
+            clauses.append("trigger_datetime >= ?")
+            parameters.append(_format_datetime(trigger_from))
+        if trigger_to is not None:
+            clauses.append("trigger_datetime <= ?")
+            parameters.append(_format_datetime(trigger_to))
+        if channels:
+            clauses.append(
+                # Only placeholders are formatted into the query, channel names are bound as parameters
+                "cfg_path IN (SELECT cfg_path FROM channels "  # noqa: S608
+                f"WHERE name IN ({', '.join('?' * len(channels))}) "
+                "GROUP BY cfg_path HAVING COUNT(DISTINCT name) = ?)",
+            )
+            parameters.extend(channels)
+            parameters.append(len(set(channels)))
+
+        query = "SELECT cfg_path, dat_path FROM records"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY trigger_datetime, cfg_path"
+        with closing(self._connection.execute(query, parameters)) as cursor:
+            for cfg_path, dat_path in cursor:
+                yield CatalogEntry(cfg_path=Path(cfg_path), dat_path=None if dat_path is None else Path(dat_path))
@@ -15,9 +15,9 @@ class Comtrade:
         self._dat = dat
 
     @classmethod
-    def load(cls: type["Comtrade"], cfg_path: "Path", dat_path: "Path") -> "Comtrade":
+    def load(cls: type["Comtrade"], cfg_path: "Path", dat_path: "Path", *, statistics: bool = False) -> "Comtrade":
         cfg = Configuration.load(cfg_path)
-        dat = Data.load(dat_path, cfg)
+        dat = Data.load(dat_path, cfg, statistics=statistics)
         return cls(cfg, dat)
 
     @property
@@ -80,6 +80,22 @@ class Analog:
     def unit(self: "Analog") -> str:
         return self._unit
 
+    @property
+    def multiplier(self: "Analog") -> dec.Decimal:
+        return self._multiplier
+
+    @property
+    def offset(self: "Analog") -> dec.Decimal:
+        return self._offset
+
+    @property
+    def minimum(self: "Analog") -> dec.Decimal:
+        return self._min
+
+    @property
+    def maximum(self: "Analog") -> dec.Decimal:
+        return self._max
+
     @property
     def skew(self: "Analog") -> dec.Decimal:
         return self._skew
@@ -190,6 +206,18 @@ class Configuration:
         self._data_file_type = DataType(data_file_type)
         self._multiplication_factor = dec.Decimal(multiplication_factor)
 
+    @property
+    def station_name(self: "Configuration") -> str:
+        return self._station_name
+
+    @property
+    def identification(self: "Configuration") -> str:
+        return self._identification
+
+    @property
+    def revision(self: "Configuration") -> int:
+        return self._revision
+
     @property
     def start_datetime(self: "Configuration") -> dt.datetime:
         return self._start_datetime
@@ -242,6 +270,10 @@ class Configuration:
     def frequency(self: "Configuration") -> dec.Decimal:
         return self._frequency
 
+    @property
+    def sample_rate(self: "Configuration") -> dec.Decimal:
+        return self._sample_rate
+
     @property
     def last_sample(self: "Configuration") -> int:
         return self._last_sample
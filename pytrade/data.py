@@ -11,14 +11,22 @@ if TYPE_CHECKING:
     from pathlib import Path
     from typing import Iterator, Sequence
 
-    from pytrade.configuration import Configuration
+    from pytrade.configuration import Analog, Configuration
 
 logger = logging.getLogger(__name__)
 
 S2MS = dec.Decimal(1_000)
 S2US = S2MS * S2MS
 DIGITAL_CHANNEL_WINDOW_SIZE = 16
+MISSING_ASCII = dec.Decimal(99_999)
+MISSING_BINARY = dec.Decimal(-32_768)
 LoadReturn = tuple[list[int], list["Analogs"], list["Digitals"]]
+Statistics = dict[str, "AnalogStatistics"]
+
+
+def convert_timestamp(timestamp: int, multiplication_factor: dec.Decimal, *, in_microseconds: bool) -> dec.Decimal:
+    """Converts a .dat timestamp to milliseconds."""
+    return (timestamp * multiplication_factor) / (S2US if in_microseconds else S2MS)
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -39,6 +47,22 @@ class ChannelSample(NamedTuple):
     sample: dec.Decimal
 
 
+class DigitalSample(NamedTuple):
+    timestamp: dec.Decimal
+    sample: bool
+
+
+class ChannelStatistics(NamedTuple):
+    minimum: dec.Decimal
+    minimum_timestamp: dec.Decimal
+    maximum: dec.Decimal
+    maximum_timestamp: dec.Decimal
+    mean: dec.Decimal
+    rms: dec.Decimal
+    peak: dec.Decimal
+    peak_timestamp: dec.Decimal
+
+
 class Channels:
     __slots__ = ()
     _timestamp: int
@@ -55,7 +79,7 @@ class Channels:
 
     def convert_timestamp(self: "Channels", multiplication_factor: dec.Decimal) -> dec.Decimal:
         """Return"""
-        return (self._timestamp * multiplication_factor) / (S2US if self._in_microseconds else S2MS)
+        return convert_timestamp(self._timestamp, multiplication_factor, in_microseconds=self._in_microseconds)
 
     def __getitem__(self: "Channels", item: str) -> dec.Decimal:
         return self._channels[item]
@@ -103,20 +127,179 @@ class Analogs(Channels):
             self._channels[channel] = channels[index]
 
 
+class AnalogStatistics:
+    """Running statistics of one analog channel, updated one sample at a time.
+
+    Raw samples are summed exactly (integers for BINARY files), mean and RMS are only derived when read.
+    Scaled values are derived from the raw aggregates, as the channel conversion is linear.
+    Samples holding the missing data marker are counted apart and left out of every other statistic.
+    """
+
+    __slots__ = (
+        "_analog",
+        "_cfg",
+        "_missing_marker",
+        "_count",
+        "_minimum",
+        "_minimum_timestamp",
+        "_maximum",
+        "_maximum_timestamp",
+        "_sum",
+        "_sum_square",
+        "_missing",
+        "_out_of_range",
+        "_first_out_of_range",
+    )
+
+    def __init__(self: "AnalogStatistics", analog: "Analog", cfg: "Configuration") -> None:
+        self._analog = analog
+        self._cfg = cfg
+        self._missing_marker = MISSING_BINARY if cfg.data_file_type == DataType.BINARY else MISSING_ASCII
+        self._count = 0
+        self._minimum: dec.Decimal | int = 0
+        self._minimum_timestamp = 0
+        self._maximum: dec.Decimal | int = 0
+        self._maximum_timestamp = 0
+        self._sum: dec.Decimal | int = 0
+        self._sum_square: dec.Decimal | int = 0
+        self._missing = 0
+        self._out_of_range = 0
+        self._first_out_of_range: int | None = None
+
+    def update(self: "AnalogStatistics", timestamp: int, sample: dec.Decimal | int) -> None:
+        if sample == self._missing_marker:
+            self._missing += 1
+            return
+        self._count += 1
+        if self._count == 1 or sample < self._minimum:
+            self._minimum = sample
+            self._minimum_timestamp = timestamp
+        if self._count == 1 or sample > self._maximum:
+            self._maximum = sample
+            self._maximum_timestamp = timestamp
+        self._sum += sample
+        self._sum_square += sample * sample
+        if not self._analog.minimum <= sample <= self._analog.maximum:
+            self._out_of_range += 1
+            if self._first_out_of_range is None:
+                self._first_out_of_range = timestamp
+
+    def merge(self: "AnalogStatistics", other: "AnalogStatistics") -> None:
+        """Merges the statistics of a later chunk of the same channel.
+
+        Args:
+            other: Statistics of the samples following the ones already seen.
+        """
+        self._missing += other._missing  # noqa: SLF001
+        if other.count == 0:
+            return
+        if self._count == 0 or other._minimum < self._minimum:  # noqa: SLF001
+            self._minimum = other._minimum  # noqa: SLF001
+            self._minimum_timestamp = other._minimum_timestamp  # noqa: SLF001
+        if self._count == 0 or other._maximum > self._maximum:  # noqa: SLF001
+            self._maximum = other._maximum  # noqa: SLF001
+            self._maximum_timestamp = other._maximum_timestamp  # noqa: SLF001
+        self._count += other.count
+        self._sum += other._sum  # noqa: SLF001
+        self._sum_square += other._sum_square  # noqa: SLF001
+        self._out_of_range += other._out_of_range  # noqa: SLF001
+        if self._first_out_of_range is None:
+            self._first_out_of_range = other._first_out_of_range  # noqa: SLF001
+
+    def _convert_timestamp(self: "AnalogStatistics", timestamp: int) -> dec.Decimal:
+        return convert_timestamp(
+            timestamp, self._cfg.multiplication_factor, in_microseconds=self._cfg.in_microseconds,
+        )
+
+    def _statistics(
+        self: "AnalogStatistics",
+        minimum: tuple[dec.Decimal, int],
+        maximum: tuple[dec.Decimal, int],
+        mean: dec.Decimal,
+        mean_square: dec.Decimal,
+    ) -> ChannelStatistics:
+        peak, peak_timestamp = max(minimum, maximum, key=lambda sample: abs(sample[0]))
+        return ChannelStatistics(
+            minimum=minimum[0],
+            minimum_timestamp=self._convert_timestamp(minimum[1]),
+            maximum=maximum[0],
+            maximum_timestamp=self._convert_timestamp(maximum[1]),
+            mean=mean,
+            rms=max(mean_square, dec.Decimal(0)).sqrt(),
+            peak=abs(peak),
+            peak_timestamp=self._convert_timestamp(peak_timestamp),
+        )
+
+    @property
+    def count(self: "AnalogStatistics") -> int:
+        """Number of samples taken into account, missing ones excluded."""
+        return self._count
+
+    @property
+    def missing(self: "AnalogStatistics") -> int:
+        """Number of samples holding the missing data marker."""
+        return self._missing
+
+    @property
+    def out_of_range(self: "AnalogStatistics") -> int:
+        """Number of raw samples outside the channel minimum and maximum."""
+        return self._out_of_range
+
+    @property
+    def first_out_of_range(self: "AnalogStatistics") -> dec.Decimal | None:
+        if self._first_out_of_range is None:
+            return None
+        return self._convert_timestamp(self._first_out_of_range)
+
+    @property
+    def raw(self: "AnalogStatistics") -> ChannelStatistics | None:
+        """Statistics of the raw .dat values, None if no sample was taken into account."""
+        if self._count == 0:
+            return None
+        return self._statistics(
+            (dec.Decimal(self._minimum), self._minimum_timestamp),
+            (dec.Decimal(self._maximum), self._maximum_timestamp),
+            dec.Decimal(self._sum) / self._count,
+            dec.Decimal(self._sum_square) / self._count,
+        )
+
+    @property
+    def scaled(self: "AnalogStatistics") -> ChannelStatistics | None:
+        """Statistics of the converted values, None if no sample was taken into account."""
+        if self._count == 0:
+            return None
+        multiplier, offset = self._analog.multiplier, self._analog.offset
+        minimum = self._analog.convert(dec.Decimal(self._minimum)), self._minimum_timestamp
+        maximum = self._analog.convert(dec.Decimal(self._maximum)), self._maximum_timestamp
+        if multiplier < 0:
+            minimum, maximum = maximum, minimum
+        total = multiplier * self._sum + offset * self._count
+        total_square = multiplier * multiplier * self._sum_square + 2 * multiplier * offset * self._sum
+        total_square += offset * offset * self._count
+        return self._statistics(minimum, maximum, total / self._count, total_square / self._count)
+
+    def __repr__(self: "AnalogStatistics") -> str:
+        return (
+            f"{self._count} samples, {self._missing} missing, {self._out_of_range} out of range: {self.scaled}"
+        )
+
+
 class Data:
-    __slots__ = ("_timestamps", "_analog_samples", "_digital_samples", "_cfg")
+    __slots__ = ("_timestamps", "_analog_samples", "_digital_samples", "_cfg", "_statistics")
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self: "Data",
         timestamps: "Sequence[int]",
         analog_samples: "Sequence[Analogs]",
         digital_samples: "Sequence[Digitals]",
         cfg: "Configuration",
+        statistics: "Statistics | None" = None,
     ) -> None:
         self._timestamps = timestamps
         self._analog_samples = analog_samples
         self._digital_samples = digital_samples
         self._cfg = cfg
+        self._statistics = statistics
 
     @property
     def cfg(self: "Data") -> "Configuration":
@@ -126,6 +309,19 @@ class Data:
     def timestamps(self: "Data") -> "Sequence[int]":
         return self._timestamps
 
+    @property
+    def statistics(self: "Data") -> "Statistics | None":
+        """Per analog channel statistics, if computed while loading."""
+        return self._statistics
+
+    @property
+    def analog_samples(self: "Data") -> "Sequence[Analogs]":
+        return self._analog_samples
+
+    @property
+    def digital_samples(self: "Data") -> "Sequence[Digitals]":
+        return self._digital_samples
+
     def __str__(self: "Data") -> str:
         string = "Analog Samples:\n"
         for analog in self._analog_samples:
@@ -155,10 +351,10 @@ class Data:
                 sample=convert_analog(sample[item]),
             )
 
-    def get_digitals_by(self: "Data", item: str) -> "Iterator[ChannelSample]":
+    def get_digitals_by(self: "Data", item: str) -> "Iterator[DigitalSample]":
         factor = self.cfg.multiplication_factor
         for sample in self._digital_samples:
-            yield ChannelSample(timestamp=sample.convert_timestamp(factor), sample=sample[item])
+            yield DigitalSample(timestamp=sample.convert_timestamp(factor), sample=bool(sample[item]))
 
     @property
     def summary(self: "Data") -> str:
@@ -170,10 +366,10 @@ class Data:
             f" = {len(self._analog_samples) * self._cfg.total_analog}\n"
             f"Digital samples: {len(self._digital_samples)} * {self._cfg.total_digital}"
             f" = {len(self._digital_samples) * self._cfg.total_digital}\n"
-        )
+        ) + "".join(f"{channel}: {statistics}\n" for channel, statistics in (self._statistics or {}).items())
 
     @staticmethod
-    def _load_ascii(path: "Path", cfg: "Configuration") -> LoadReturn:
+    def _load_ascii(path: "Path", cfg: "Configuration", statistics: "Statistics | None") -> LoadReturn:
         with path.open() as dat_file:
             timestamps = []
             analog_samples = []
@@ -187,6 +383,9 @@ class Data:
                 if cfg.total_channels != len(channels):
                     msg = "The number of channels in .dat differs from the .cfg file"
                     raise ValueError(msg)
+                if statistics is not None:
+                    for channel, sample in zip(cfg.analogs_order, analog_channels, strict=True):
+                        statistics[channel].update(timestamp, sample)
 
                 timestamps.append(timestamp)
                 in_us = cfg.in_microseconds
@@ -205,7 +404,7 @@ class Data:
         return timestamps, analog_samples, digital_samples
 
     @staticmethod
-    def _load_binary(path: "Path", cfg: "Configuration") -> LoadReturn:
+    def _load_binary(path: "Path", cfg: "Configuration", statistics: "Statistics | None") -> LoadReturn:
         with path.open(mode="rb") as dat_file:
             timestamps = []
             analog_samples = []
@@ -214,7 +413,8 @@ class Data:
                 dat_file.read(4)  # sample number
                 timestamp = unpack("<I", dat_file.read(4))[0]
                 in_us = cfg.in_microseconds
-                analog_channels = [dec.Decimal(unpack("<h", dat_file.read(2))[0]) for _ in range(cfg.total_analog)]
+                raw_analogs = [unpack("<h", dat_file.read(2))[0] for _ in range(cfg.total_analog)]
+                analog_channels = [dec.Decimal(sample) for sample in raw_analogs]
                 digital_channels = []
                 ceiling = ceil(cfg.total_digital / DIGITAL_CHANNEL_WINDOW_SIZE)
                 for index in range(1, ceiling + 1):
@@ -224,6 +424,9 @@ class Data:
                         (index * DIGITAL_CHANNEL_WINDOW_SIZE) - cfg.total_digital
                     )
                     digital_channels.extend([bool((digitals >> bit) & 1) for bit in range(bits)])
+                if statistics is not None:
+                    for channel, raw_sample in zip(cfg.analogs_order, raw_analogs, strict=True):
+                        statistics[channel].update(timestamp, raw_sample)
                 timestamps.append(timestamp)
                 analog_samples.append(Analogs(
                     timestamp=timestamp, in_microseconds=in_us,
@@ -236,12 +439,13 @@ class Data:
         return timestamps, analog_samples, digital_samples
 
     @classmethod
-    def load(cls: type["Data"], path: "Path", cfg: "Configuration") -> "Data":
+    def load(cls: type["Data"], path: "Path", cfg: "Configuration", *, statistics: bool = False) -> "Data":
         """Loads .dat file. Expects a .cfg object.
 
         Args:
             path: Path to the .dat file.
             cfg: Loaded .cfg file.
+            statistics: Also compute the analog channels statistics while decoding.
 
         Returns:
             Loaded .dat object.
@@ -249,12 +453,16 @@ class Data:
         Raises:
             ValueError: If the number of channels in .dat differs from .cfg.
         """
+        channels_statistics = (
+            {channel: AnalogStatistics(cfg.analogs[channel], cfg) for channel in cfg.analogs_order}
+            if statistics else None
+        )
         match cfg.data_file_type:
             case DataType.ASCII:
-                timestamps, analog_samples, digital_samples = cls._load_ascii(path, cfg)
+                timestamps, analog_samples, digital_samples = cls._load_ascii(path, cfg, channels_statistics)
             case DataType.BINARY:
-                timestamps, analog_samples, digital_samples = cls._load_binary(path, cfg)
+                timestamps, analog_samples, digital_samples = cls._load_binary(path, cfg, channels_statistics)
             case default:
                 msg = f"Unknown {default} file type for .dat COMTRADE"
                 raise TypeError(msg)
-        return cls(timestamps, analog_samples, digital_samples, cfg)
+        return cls(timestamps, analog_samples, digital_samples, cfg, channels_statistics)
@@ -0,0 +1,243 @@
+import decimal as dec
+import logging
+import pickle
+import sys
+import threading
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from struct import calcsize, pack_into, unpack_from
+from typing import TYPE_CHECKING
+
+from pytrade.configuration import DataType
+from pytrade.data import ChannelSample, DigitalSample, convert_timestamp
+
+if TYPE_CHECKING:
+    from typing import Iterator, Sized
+
+    from pytrade.comtrade import Comtrade
+    from pytrade.configuration import Configuration
+
+logger = logging.getLogger(__name__)
+
+HEADER_FORMAT = "<QQQQ"  # samples, analog channels, digital channels, pickled .cfg size
+HEADER_SIZE = calcsize(HEADER_FORMAT)
+ALIGNMENT = 8
+TIMESTAMP_TYPE = "q"
+ANALOG_TYPE = "d"
+BINARY_ANALOG_TYPE = "h"
+DIGITAL_TYPE = "B"
+_untracked_lock = threading.Lock()
+
+
+def _align(size: int) -> int:
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+def _attach_untracked(name: str) -> SharedMemory:
+    """Same as `SharedMemory(name, track=False)`, which only exists since Python 3.13.
+
+    The resource tracker unlinks every segment registered by a process when it exits. Unregistering right after
+    attaching is not enough, as pool workers share the publisher's tracker and would drop its registration instead.
+    """
+    register = resource_tracker.register
+    segment = name.lstrip("/")
+
+    def register_others(name: "Sized", rtype: object) -> None:
+        if rtype != "shared_memory" or str(name).lstrip("/") != segment:
+            register(name, rtype)
+
+    with _untracked_lock:
+        resource_tracker.register = register_others
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _analog_type(cfg: "Configuration") -> str:
+    return BINARY_ANALOG_TYPE if cfg.data_file_type == DataType.BINARY else ANALOG_TYPE
+
+
+def _columns_size(cfg: "Configuration", total_samples: int) -> int:
+    return (
+        _align(total_samples * calcsize(TIMESTAMP_TYPE))
+        + cfg.total_analog * _align(total_samples * calcsize(_analog_type(cfg)))
+        + cfg.total_digital * _align(total_samples * calcsize(DIGITAL_TYPE))
+    )
+
+
+class SharedRecord:
+    """Loaded COMTRADE record stored once in shared memory, as read-only columns.
+
+    The segment holds a small header, the pickled .cfg object, the timestamps and one contiguous column per
+    channel, so any process can attach to it by name without copying or decoding the .dat file again.
+    Analog columns keep the raw .dat values (int16 for BINARY files), use `get_analogs_by` for converted values.
+    """
+
+    __slots__ = ("_shm", "_is_owner", "_cfg", "_timestamps", "_analogs", "_digitals")
+
+    def __init__(self: "SharedRecord", shm: SharedMemory, *, is_owner: bool) -> None:
+        self._shm = shm
+        self._is_owner = is_owner
+        buffer = shm.buf.toreadonly()
+        total_samples, total_analog, total_digital, cfg_size = unpack_from(HEADER_FORMAT, buffer)
+        offset = HEADER_SIZE
+        self._cfg: Configuration = pickle.loads(buffer[offset:offset + cfg_size])  # noqa: S301
+        offset += _align(cfg_size)
+
+        size = total_samples * calcsize(TIMESTAMP_TYPE)
+        self._timestamps = buffer[offset:offset + size].cast(TIMESTAMP_TYPE)
+        offset += _align(size)
+
+        self._analogs = {}
+        analog_type = _analog_type(self._cfg)
+        size = total_samples * calcsize(analog_type)
+        for channel in self._cfg.analogs_order[:total_analog]:
+            self._analogs[channel] = buffer[offset:offset + size].cast(analog_type)
+            offset += _align(size)
+
+        self._digitals = {}
+        size = total_samples * calcsize(DIGITAL_TYPE)
+        for channel in self._cfg.digitals_order[:total_digital]:
+            self._digitals[channel] = buffer[offset:offset + size].cast(DIGITAL_TYPE)
+            offset += _align(size)
+        buffer.release()
+
+    @classmethod
+    def publish(cls: type["SharedRecord"], comtrade: "Comtrade", name: str | None = None) -> "SharedRecord":
+        """Copies a loaded record into a new shared memory segment.
+
+        The publishing process owns the segment and must `unlink` it once every worker is done.
+        Columns are written straight into the segment, so no intermediate copy of the record is made.
+
+        Args:
+            comtrade: Loaded record.
+            name: Name of the segment, a random one is generated if omitted.
+
+        Returns:
+            Shared record owning the new segment.
+        """
+        cfg = comtrade.cfg
+        dat = comtrade.dat
+        total_samples = len(dat.timestamps)
+        analog_type = _analog_type(cfg)
+        convert_analog = int if analog_type == BINARY_ANALOG_TYPE else float
+        pickled_cfg = pickle.dumps(cfg, protocol=pickle.HIGHEST_PROTOCOL)
+
+        size = HEADER_SIZE + _align(len(pickled_cfg)) + _columns_size(cfg, total_samples)
+        shm = SharedMemory(name=name, create=True, size=max(size, 1))
+        try:
+            pack_into(HEADER_FORMAT, shm.buf, 0, total_samples, cfg.total_analog, cfg.total_digital, len(pickled_cfg))
+            offset = HEADER_SIZE
+            shm.buf[offset:offset + len(pickled_cfg)] = pickled_cfg
+            offset += _align(len(pickled_cfg))
+
+            column_size = total_samples * calcsize(TIMESTAMP_TYPE)
+            with shm.buf[offset:offset + column_size].cast(TIMESTAMP_TYPE) as column:
+                for index, timestamp in enumerate(dat.timestamps):
+                    column[index] = timestamp
+            offset += _align(column_size)
+
+            column_size = total_samples * calcsize(analog_type)
+            for channel in cfg.analogs_order:
+                with shm.buf[offset:offset + column_size].cast(analog_type) as column:
+                    for index, analogs in enumerate(dat.analog_samples):
+                        column[index] = convert_analog(analogs[channel])
+                offset += _align(column_size)
+
+            column_size = total_samples * calcsize(DIGITAL_TYPE)
+            for channel in cfg.digitals_order:
+                with shm.buf[offset:offset + column_size].cast(DIGITAL_TYPE) as column:
+                    for index, digitals in enumerate(dat.digital_samples):
+                        column[index] = int(digitals[channel])
+                offset += _align(column_size)
+            record = cls(shm, is_owner=True)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        logger.debug("Published %s into shared memory %s (%d bytes)", cfg.id, shm.name, size)
+        return record
+
+    @classmethod
+    def attach(cls: type["SharedRecord"], name: str) -> "SharedRecord":
+        """Attaches to a segment created by `publish`, possibly in another process.
+
+        Args:
+            name: Name of the segment.
+
+        Returns:
+            Read-only view of the shared record.
+        """
+        if sys.version_info >= (3, 13):
+            shm = SharedMemory(name=name, track=False)
+        else:
+            shm = _attach_untracked(name)
+        return cls(shm, is_owner=False)
+
+    @property
+    def name(self: "SharedRecord") -> str:
+        return self._shm.name
+
+    @property
+    def cfg(self: "SharedRecord") -> "Configuration":
+        return self._cfg
+
+    @property
+    def timestamps(self: "SharedRecord") -> memoryview:
+        return self._timestamps
+
+    def get_raw_analog(self: "SharedRecord", item: str) -> memoryview:
+        return self._analogs[item]
+
+    def get_raw_digital(self: "SharedRecord", item: str) -> memoryview:
+        return self._digitals[item]
+
+    def convert_timestamp(self: "SharedRecord", timestamp: int) -> dec.Decimal:
+        return convert_timestamp(
+            timestamp, self._cfg.multiplication_factor, in_microseconds=self._cfg.in_microseconds,
+        )
+
+    def get_analogs_by(self: "SharedRecord", item: str) -> "Iterator[ChannelSample]":
+        convert_analog = self._cfg.analogs[item].convert
+        for timestamp, sample in zip(self._timestamps, self._analogs[item], strict=True):
+            yield ChannelSample(
+                timestamp=self.convert_timestamp(timestamp),
+                sample=convert_analog(dec.Decimal(repr(sample))),
+            )
+
+    def get_digitals_by(self: "SharedRecord", item: str) -> "Iterator[DigitalSample]":
+        for timestamp, sample in zip(self._timestamps, self._digitals[item], strict=True):
+            yield DigitalSample(timestamp=self.convert_timestamp(timestamp), sample=bool(sample))
+
+    def close(self: "SharedRecord") -> None:
+        """Releases this process' views and detaches from the segment.
+
+        Views returned by this object must not be used (nor kept alive) after closing.
+        """
+        for view in (self._timestamps, *self._analogs.values(), *self._digitals.values()):
+            view.release()
+        self._analogs.clear()
+        self._digitals.clear()
+        self._shm.close()
+
+    def unlink(self: "SharedRecord") -> None:
+        """Frees the segment, only allowed for the publishing process.
+
+        A segment that was already freed (e.g. by another process) is only logged.
+        """
+        if not self._is_owner:
+            msg = f"Shared memory {self.name} can only be unlinked by its publisher"
+            raise PermissionError(msg)
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            logger.warning("Shared memory %s was already unlinked", self.name)
+
+    def __enter__(self: "SharedRecord") -> "SharedRecord":
+        return self
+
+    def __exit__(self: "SharedRecord", *_: object) -> None:
+        self.close()
+        if self._is_owner:
+            self.unlink()
@@ -0,0 +1,37 @@
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytrade.comtrade import Comtrade
+
+if TYPE_CHECKING:
+    from typing import Protocol
+
+    class Load(Protocol):
+        def __call__(self: "Load", record: str, *, statistics: bool = False) -> Comtrade: ...
+
+DATA = Path(__file__).parent.parent / "data"
+RECORDS = {
+    "pub1": ("pub1.cfg", "pub1.dat"),
+    "1999pub0": ("1999pub0.CFG", "1999pub0.DAT"),
+    "1999sub0": ("1999sub0.CFG", "1999sub0.DAT"),
+}
+
+
+@pytest.fixture()
+def archive(tmp_path: Path) -> Path:
+    """Copy of the bundled records, safe to modify."""
+    return Path(shutil.copytree(DATA, tmp_path / "data"))
+
+
+@pytest.fixture()
+def load() -> "Load":
+    """Loads one of the bundled records by name."""
+
+    def load_record(record: str, *, statistics: bool = False) -> Comtrade:
+        cfg_name, dat_name = RECORDS[record]
+        return Comtrade.load(DATA / cfg_name, DATA / dat_name, statistics=statistics)
+
+    return load_record
@@ -0,0 +1,60 @@
+import datetime as dt
+from pathlib import Path
+
+import pytest
+
+from pytrade.catalog import Catalog
+from pytrade.configuration import DataType
+
+
+def _names(catalog: Catalog, **filters: object) -> list[str]:
+    return [entry.cfg_path.name for entry in catalog.search(**filters)]  # type: ignore[arg-type]
+
+
+def test_update_and_search(archive: Path, tmp_path: Path) -> None:
+    with Catalog(tmp_path / "catalog.db") as catalog:
+        assert catalog.update(archive, workers=2) == 3
+        assert len(catalog) == 3
+        assert catalog.update(archive, workers=2) == 0
+
+        assert _names(catalog, data_file_type=DataType.BINARY) == ["pub1.cfg"]
+        # .cfg datetimes are naive, so are the filters
+        trigger_from = dt.datetime(2023, 6, 22, 23, 39, 21)  # noqa: DTZ001
+        assert _names(catalog, trigger_from=trigger_from) == ["pub1.cfg"]
+        with pytest.raises(ValueError, match="naive"):
+            _names(catalog, trigger_from=trigger_from.replace(tzinfo=dt.timezone.utc))
+        assert sorted(_names(catalog, channels=["IAW", "TRIP"])) == ["1999pub0.CFG", "1999sub0.CFG", "pub1.cfg"]
+        assert _names(catalog, channels=["IAW", "MISSING"]) == []
+
+        entry = next(catalog.search(data_file_type=DataType.BINARY))
+        assert entry.dat_path == archive / "pub1.dat"
+
+
+def test_update_removes_deleted_files(archive: Path, tmp_path: Path) -> None:
+    with Catalog(tmp_path / "catalog.db") as catalog:
+        catalog.update(archive, workers=2)
+        (archive / "pub1.cfg").unlink()
+        assert catalog.update(archive, workers=2) == 0
+        assert len(catalog) == 2
+
+
+def test_update_skips_malformed_files(archive: Path, tmp_path: Path) -> None:
+    cfg_path = archive / "1999sub0.CFG"
+    lines = cfg_path.read_text().splitlines(keepends=True)
+    frequency = 2 + 14 + 184  # header, analog and digital channels
+    lines[frequency] = "6O\n"
+    cfg_path.write_text("".join(lines))
+
+    with Catalog(tmp_path / "catalog.db") as catalog:
+        assert catalog.update(archive, workers=2) == 2
+        assert "1999sub0.CFG" not in _names(catalog)
+
+
+def test_update_drops_files_that_became_malformed(archive: Path, tmp_path: Path) -> None:
+    with Catalog(tmp_path / "catalog.db") as catalog:
+        catalog.update(archive, workers=2)
+        (archive / "pub1.cfg").write_text("garbage\n")
+        assert catalog.update(archive, workers=2) == 0
+        assert "pub1.cfg" not in _names(catalog, channels=["IAW"])
+        assert len(catalog) == 2
+        assert catalog.update(archive, workers=2) == 0
@@ -0,0 +1,87 @@
+import decimal as dec
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytrade.data import AnalogStatistics
+
+if TYPE_CHECKING:
+    from conftest import Load
+
+TOLERANCE = dec.Decimal("1e-20")
+
+
+@pytest.mark.parametrize("record", ["pub1", "1999pub0", "1999sub0"])
+def test_statistics_match_second_pass(load: "Load", record: str) -> None:
+    comtrade = load(record, statistics=True)
+    statistics = comtrade.dat.statistics
+    assert statistics is not None
+    for channel in ("IAW", "VAY"):
+        samples = list(comtrade.dat.get_analogs_by(channel))
+        values = [sample.sample for sample in samples]
+        scaled = statistics[channel].scaled
+        assert scaled is not None
+        assert statistics[channel].count == len(values)
+        assert statistics[channel].missing == 0
+        assert scaled.minimum == min(values)
+        assert scaled.maximum == max(values)
+        assert abs(scaled.mean - sum(values, dec.Decimal(0)) / len(values)) < TOLERANCE
+        mean_square = sum((value * value for value in values), dec.Decimal(0)) / len(values)
+        assert abs(scaled.rms - mean_square.sqrt()) < TOLERANCE
+        peak = max(samples, key=lambda sample: abs(sample.sample))
+        assert scaled.peak == abs(peak.sample)
+        assert scaled.peak_timestamp == peak.timestamp
+        assert scaled.minimum_timestamp == min(samples, key=lambda sample: sample.sample).timestamp
+
+
+def test_raw_statistics_are_exact(load: "Load") -> None:
+    comtrade = load("pub1", statistics=True)
+    assert comtrade.dat.statistics is not None
+    raw = comtrade.dat.statistics["IAW"].raw
+    assert raw is not None
+    values = [int(samples["IAW"]) for samples in comtrade.dat.analog_samples]
+    assert raw.mean == dec.Decimal(sum(values)) / len(values)
+    assert raw.rms == (dec.Decimal(sum(value * value for value in values)) / len(values)).sqrt()
+
+
+@pytest.mark.parametrize("record", ["pub1", "1999pub0"])
+def test_statistics_skip_missing_marker(load: "Load", record: str) -> None:
+    comtrade = load(record, statistics=True)
+    assert comtrade.dat.statistics is not None
+    vdc = comtrade.dat.statistics["VDC1"]
+    assert vdc.missing == 600
+    assert vdc.count == 600
+    assert vdc.out_of_range == 0
+    assert vdc.first_out_of_range is None
+    assert vdc.raw is not None
+    assert vdc.raw.maximum <= comtrade.cfg.analogs["VDC1"].maximum
+
+
+@pytest.mark.parametrize("record", ["pub1", "1999pub0"])
+def test_statistics_without_samples(load: "Load", record: str) -> None:
+    comtrade = load(record)
+    analog = comtrade.cfg.analogs["VDC1"]
+    statistics = AnalogStatistics(analog, comtrade.cfg)
+    assert statistics.raw is None
+    assert statistics.scaled is None
+
+    for samples in comtrade.dat.analog_samples:
+        if samples["VDC1"] == (-32768 if record == "pub1" else 99999):
+            statistics.update(samples.timestamp, samples["VDC1"])
+    assert (statistics.count, statistics.missing) == (0, 600)
+    assert statistics.raw is None
+    assert statistics.scaled is None
+
+
+def test_statistics_merge_chunks(load: "Load") -> None:
+    comtrade = load("1999pub0", statistics=True)
+    assert comtrade.dat.statistics is not None
+    for channel in ("IAW", "VDC1"):
+        analog = comtrade.cfg.analogs[channel]
+        first, second = AnalogStatistics(analog, comtrade.cfg), AnalogStatistics(analog, comtrade.cfg)
+        for index, samples in enumerate(comtrade.dat.analog_samples):
+            (first if index < 500 else second).update(samples.timestamp, samples[channel])
+        first.merge(second)
+        expected = comtrade.dat.statistics[channel]
+        assert (first.count, first.missing) == (expected.count, expected.missing)
+        assert first.scaled == expected.scaled
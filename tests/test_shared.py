@@ -0,0 +1,50 @@
+import subprocess
+import sys
+from multiprocessing import Pool
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytrade.shared import SharedRecord
+
+if TYPE_CHECKING:
+    from conftest import Load
+
+ATTACH = "import sys; from pytrade.shared import SharedRecord; SharedRecord.attach(sys.argv[1]).close()"
+
+
+def _first_trip(name: str) -> tuple[int, bool]:
+    with SharedRecord.attach(name) as record:
+        return len(record.timestamps), next(record.get_digitals_by("TRIP")).sample
+
+
+@pytest.mark.parametrize(("record", "analog_type"), [("pub1", "h"), ("1999sub0", "d")])
+def test_publish_matches_data(load: "Load", record: str, analog_type: str) -> None:
+    comtrade = load(record)
+    with SharedRecord.publish(comtrade) as shared:
+        assert shared.cfg.id == comtrade.cfg.id
+        assert list(shared.timestamps) == list(comtrade.dat.timestamps)
+        assert shared.get_raw_analog("IAW").format == analog_type
+        assert shared.get_raw_analog("IAW").readonly
+        for channel in ("IAW", "VAY"):
+            assert list(shared.get_analogs_by(channel)) == list(comtrade.dat.get_analogs_by(channel))
+        assert list(shared.get_digitals_by("TRIP")) == list(comtrade.dat.get_digitals_by("TRIP"))
+        assert all(isinstance(sample.sample, bool) for sample in shared.get_digitals_by("TRIP"))
+
+
+def test_attach_from_other_processes(load: "Load") -> None:
+    with SharedRecord.publish(load("pub1")) as shared:
+        with Pool(2) as pool:
+            assert pool.map(_first_trip, [shared.name] * 2) == [(1200, False)] * 2
+        for _ in range(2):
+            # Runs this interpreter on a constant snippet, the only argument is the segment name
+            subprocess.run([sys.executable, "-c", ATTACH, shared.name], check=True)  # noqa: S603
+        with SharedRecord.attach(shared.name) as attached, pytest.raises(PermissionError):
+            attached.unlink()
+
+
+def test_unlink_already_freed_segment(load: "Load") -> None:
+    shared = SharedRecord.publish(load("pub1"))
+    shared.unlink()
+    shared.unlink()
+    shared.close()